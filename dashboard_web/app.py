@@ -2,11 +2,16 @@
 from __future__ import annotations
 import sys
 import subprocess
+import hashlib
+import heapq
 import json
+import mmap
 import os
 import re
+import string
 import time
 import math
+from collections import OrderedDict
 #from pydantic import BaseModel
 from datetime import datetime, timezone
 from pathlib import Path
@@ -15,13 +20,20 @@ from contextlib import asynccontextmanager
 from fastapi.security import APIKeyHeader
 from fastapi import Security
 from fastapi import FastAPI, HTTPException, Query, Response, Depends, BackgroundTasks
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.requests import Request
 import pandas as pd
 import numpy as np
 
+# orjson parses straight from bytes and is several times faster than the
+# stdlib parser; fall back to stdlib json if it is not installed.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 # --- Phase 1: Security & Database Imports ---
 from pydantic import BaseModel
 #import bcrypt
@@ -54,8 +66,19 @@ LIVE_HEARTBEAT = DATA_DIR / "live_heartbeat.touch"
 # Keep this short so dashboard goes blank quickly when nothing is connected.
 RESULTS_STALE_AFTER_SEC = 10
 
-# run_id safety (avoid path traversal)
-SAFE_RUN_ID_RE = re.compile(r"^[A-Za-z0-9_-]{6,80}$")
+# run_id safety (avoid path traversal): [A-Za-z0-9_-]{6,80}. A translate
+# table that deletes every allowed character is faster per call than the
+# regex engine for this simple character class.
+_RUN_ID_DROP = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
+
+
+def _is_safe_run_id(run_id: Any) -> bool:
+    return (
+        isinstance(run_id, str)
+        and 6 <= len(run_id) <= 80
+        and not run_id.translate(_RUN_ID_DROP)
+    )
+
 SELFTEST_JSON = DATA_DIR / "selftest.json"
 # -------------------------------------------------------------------
 # App
@@ -146,7 +169,7 @@ def _is_live_connected() -> bool:
 
         # 2) Sticky mode for your project:
         #    if exported dashboard files exist, keep UI as LIVE
-        latest = read_json(LATEST_JSON)
+        latest = cached_read_json(LATEST_JSON)
         if isinstance(latest, dict) and latest:
             return True
 
@@ -163,29 +186,84 @@ def ensure_dirs() -> None:
     RUNS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Archived run files above this size are parsed via mmap so the parser
+# reads straight from the page cache instead of a private bytes buffer.
+_MMAP_MIN_BYTES = 256 * 1024
+
+
 def read_json(path: Path) -> Dict[str, Any]:
     """
     Safe JSON reader; returns {} on error/missing/non-dict.
+    Large files are memory-mapped rather than copied into a buffer.
     """
     if not path.exists():
         return {}
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        if path.stat().st_size > _MMAP_MIN_BYTES:
+            payload = _read_json_mmap(path)
+        else:
+            raw = path.read_bytes()
+            payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return payload if isinstance(payload, dict) else {}
     except Exception:
         return {}
 
 
-def read_text(path: Path) -> str:
+def _read_json_mmap(path: Path) -> Any:
     """
-    Safe text reader; returns empty string on error/missing.
+    Parse a JSON file through a read-only memory map (no user-space copy
+    with orjson; stdlib json needs the bytes materialized).
     """
-    if not path.exists():
-        return ""
+    fd = os.open(path, os.O_RDONLY)
     try:
-        return path.read_text(encoding="utf-8")
-    except Exception:
-        return ""
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    try:
+        if orjson is not None:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+        return json.loads(bytes(mm))
+    finally:
+        mm.close()
+
+
+# Parsed-file cache keyed by (st_mtime_ns, st_size). The data files only
+# change when the backend writes a new run, so a stat() is enough to detect
+# staleness and dashboard polling stops re-parsing identical files. The
+# cache is a bounded LRU: archived run payloads flow through it too, and an
+# unbounded dict would let a client walking /api/run/{run_id} pin the whole
+# runs/ archive in memory. The few hot fixed paths (latest/previous/index)
+# are touched on every poll, so eviction only sheds cold run files.
+_JSON_CACHE: "OrderedDict[Path, tuple]" = OrderedDict()
+_JSON_CACHE_MAX = 64
+
+
+def cached_read_json(path: Path) -> Dict[str, Any]:
+    """
+    read_json with a bounded LRU cache invalidated by file mtime/size.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        _JSON_CACHE.pop(path, None)
+        return {}
+
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _JSON_CACHE.get(path)
+    if hit is not None and hit[0] == key:
+        _JSON_CACHE.move_to_end(path)
+        return hit[1]
+
+    payload = read_json(path)
+    _JSON_CACHE[path] = (key, payload)
+    _JSON_CACHE.move_to_end(path)
+    while len(_JSON_CACHE) > _JSON_CACHE_MAX:
+        _JSON_CACHE.popitem(last=False)
+    return payload
 
 
 def write_json_atomic(path: Path, payload: Dict[str, Any]) -> None:
@@ -210,14 +288,79 @@ def no_cache_headers(resp: Response) -> None:
     resp.headers["Expires"] = "0"
 
 
+# Pre-serialized response bodies keyed by endpoint; each entry stores the
+# stat() fingerprint of its source files so a poll that changed nothing is
+# answered with cached bytes instead of rebuilding and re-encoding dicts.
+# Per-run bodies live in their own bounded LRU since run ids are open-ended.
+_PREBUILT: Dict[Any, tuple] = {}
+_RUN_PREBUILT: "OrderedDict[str, tuple]" = OrderedDict()
+_RUN_PREBUILT_MAX = 16
+
+
+def _stat_key(path: Path) -> Optional[tuple]:
+    try:
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _json_bytes(payload: Any) -> bytes:
+    """
+    Serialize an API payload to UTF-8 JSON bytes once, for ETag + body reuse.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    RFC 7232 If-None-Match check against one quoted entity-tag: handles
+    '*', comma-separated lists and weak ('W/') prefixes, so spec-compliant
+    clients and intermediaries still get their 304s.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == etag:
+            return True
+    return False
+
+
+def etag_response(request: Request, payload_bytes: bytes) -> Response:
+    """
+    JSON response with an ETag; returns 304 with an empty body when the
+    client's If-None-Match already matches, so unchanged-data polls skip
+    re-serialization and transfer. Cache-Control stays revalidate-always.
+    """
+    etag = hashlib.blake2b(payload_bytes, digest_size=16).hexdigest()
+    headers = {
+        "ETag": f'"{etag}"',
+        "Cache-Control": "no-cache, must-revalidate, max-age=0",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=payload_bytes,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
 def safe_run_path(run_id: str) -> Path:
-    if not SAFE_RUN_ID_RE.match(run_id):
+    if not _is_safe_run_id(run_id):
         raise HTTPException(status_code=400, detail="Invalid run_id format")
     return RUNS_DIR / f"{run_id}.json"
 
 
 def safe_report_path(run_id: str) -> Path:
-    if not SAFE_RUN_ID_RE.match(run_id):
+    if not _is_safe_run_id(run_id):
         raise HTTPException(status_code=400, detail="Invalid run_id format")
     return RUNS_DIR / f"{run_id}.report.html"
 
@@ -478,7 +621,7 @@ def _history_from_index(n: int) -> Optional[List[Dict[str, Any]]]:
       {"runs": [...]}   (legacy alternate key)
     Returns None if file/schema unavailable.
     """
-    idx = read_json(HISTORY_INDEX_JSON)
+    idx = cached_read_json(HISTORY_INDEX_JSON)
     items = None
 
     if isinstance(idx.get("items"), list):
@@ -500,8 +643,16 @@ def _history_from_runs_scan(n: int) -> List[Dict[str, Any]]:
     if not RUNS_DIR.exists():
         return out
 
-    for p in RUNS_DIR.glob("*.json"):
-        run = read_json(p)
+    # scandir DirEntries carry cached stat info (one syscall per entry at
+    # most), and nlargest keeps only the n freshest files by mtime so we
+    # never parse the whole archive for a small history page.
+    with os.scandir(RUNS_DIR) as it:
+        entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+
+    top = heapq.nlargest(n, entries, key=lambda e: e.stat().st_mtime_ns)
+
+    for e in top:
+        run = cached_read_json(Path(e.path))
         if isinstance(run, dict) and run:
             item = slim_run_payload(run)
 
@@ -509,7 +660,7 @@ def _history_from_runs_scan(n: int) -> List[Dict[str, Any]]:
             if not item.get("saved_at"):
                 try:
                     item["saved_at"] = datetime.fromtimestamp(
-                        p.stat().st_mtime
+                        e.stat().st_mtime
                     ).isoformat(timespec="seconds")
                 except Exception:
                     item["saved_at"] = item.get("generated_at")
@@ -729,9 +880,36 @@ def receive_drift_data(
 # -------------------------------------------------------------------
 # Routes
 # -------------------------------------------------------------------
+# Rendered index.html bytes per (scheme, host): the template is a static
+# SPA shell whose only dynamic parts are url_for() links, which depend
+# solely on the request's base URL — so render once and serve bytes.
+# Bounded LRU: scheme/host come from the client's Host header, so without
+# a cap arbitrary Hosts could each pin another rendered body in memory.
+_INDEX_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_INDEX_CACHE_MAX = 4
+
+
 @app.get("/", response_class=HTMLResponse)
 def home(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    key = (request.url.scheme, request.url.netloc)
+    cached = _INDEX_CACHE.get(key)
+    if cached is None:
+        body = bytes(
+            templates.TemplateResponse(request, "index.html").body
+        )
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        cached = (body, etag)
+        _INDEX_CACHE[key] = cached
+        while len(_INDEX_CACHE) > _INDEX_CACHE_MAX:
+            _INDEX_CACHE.popitem(last=False)
+    else:
+        _INDEX_CACHE.move_to_end(key)
+
+    body, etag = cached
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "public, max-age=300"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
 @app.get("/login", response_class=HTMLResponse)
 def login_page(request: Request):
     """Serves the Login UI"""
@@ -772,37 +950,47 @@ def api_health(response: Response):
 
 
 @app.get("/api/results")
-def api_results(response: Response):
+def api_results(request: Request):
     """
     Returns latest + previous payloads only if a fresh live signal exists.
     If nothing is actively updating the dashboard, return empty objects
     so the UI shows '-' instead of stale values.
     Also returns live_connected flag for frontend messaging.
+
+    Emits an ETag so polling clients get 304 when nothing changed.
     """
     ensure_dirs()
 
     live_connected = _is_live_connected()
 
-    if not live_connected:
-        no_cache_headers(response)
-        return {"latest": {}, "previous": {}, "live_connected": False}
+    key = ("results", live_connected, _stat_key(LATEST_JSON), _stat_key(PREVIOUS_JSON))
+    hit = _PREBUILT.get("results")
+    if hit is not None and hit[0] == key:
+        return etag_response(request, hit[1])
 
-    latest = read_json(LATEST_JSON)
-    if not latest:
-        no_cache_headers(response)
-        return {"latest": {}, "previous": {}, "live_connected": False}
+    if live_connected:
+        latest = cached_read_json(LATEST_JSON)
+    else:
+        latest = {}
 
-    previous = read_json(PREVIOUS_JSON)
+    if not latest:
+        payload = {"latest": {}, "previous": {}, "live_connected": False}
+    else:
+        previous = cached_read_json(PREVIOUS_JSON)
+        payload = {"latest": latest, "previous": previous, "live_connected": True}
 
-    no_cache_headers(response)
-    return {"latest": latest, "previous": previous, "live_connected": True}
+    body = _json_bytes(payload)
+    _PREBUILT["results"] = (key, body)
+    return etag_response(request, body)
 
 
 @app.get("/api/run/{run_id}")
-def api_run(run_id: str, response: Response):
+def api_run(run_id: str, request: Request):
     """
     Return full archived run payload from:
       dashboard_web/data/runs/{run_id}.json
+
+    Emits an ETag so polling clients get 304 when nothing changed.
     """
     ensure_dirs()
 
@@ -810,17 +998,29 @@ def api_run(run_id: str, response: Response):
     if not p.exists():
         raise HTTPException(status_code=404, detail="Run not found")
 
-    payload = read_json(p)
+    # Archived runs are immutable once written, so unchanged polls are
+    # answered from cached bytes without re-serializing the payload.
+    key = ("run", run_id, _stat_key(p))
+    hit = _RUN_PREBUILT.get(run_id)
+    if hit is not None and hit[0] == key:
+        _RUN_PREBUILT.move_to_end(run_id)
+        return etag_response(request, hit[1])
+
+    payload = cached_read_json(p)
     if not payload:
         raise HTTPException(status_code=500, detail="Run file is empty or invalid JSON")
 
-    no_cache_headers(response)
-    return payload
+    body = _json_bytes(payload)
+    _RUN_PREBUILT[run_id] = (key, body)
+    _RUN_PREBUILT.move_to_end(run_id)
+    while len(_RUN_PREBUILT) > _RUN_PREBUILT_MAX:
+        _RUN_PREBUILT.popitem(last=False)
+    return etag_response(request, body)
 
 
 @app.get("/api/history")
 def api_history(
-    response: Response,
+    request: Request,
     n: int = Query(default=20, ge=1, le=200),
 ):
     """
@@ -828,9 +1028,18 @@ def api_history(
 
     Prefer dashboard_web/data/history_index.json (fast).
     Falls back to scanning runs/*.json.
+
+    Emits an ETag so polling clients get 304 when nothing changed.
     """
     ensure_dirs()
 
+    # RUNS_DIR's stat covers the scan fallback: atomic writes into the
+    # directory bump its mtime, so the key changes whenever runs change.
+    key = ("history", n, _stat_key(HISTORY_INDEX_JSON), _stat_key(RUNS_DIR))
+    hit = _PREBUILT.get(("history", n))
+    if hit is not None and hit[0] == key:
+        return etag_response(request, hit[1])
+
     items = _history_from_index(n)
     source = "history_index"
 
@@ -838,8 +1047,9 @@ def api_history(
         items = _history_from_runs_scan(n)
         source = "scan_runs"
 
-    no_cache_headers(response)
-    return {"runs": items, "source": source}
+    body = _json_bytes({"runs": items, "source": source})
+    _PREBUILT[("history", n)] = (key, body)
+    return etag_response(request, body)
 
 
 @app.post("/api/history/clear")
@@ -858,7 +1068,26 @@ def api_history_clear(response: Response):
     }
 
 
-@app.get("/api/report/latest", response_class=HTMLResponse)
+def _report_file_ok(path: Path) -> bool:
+    try:
+        return path.is_file() and path.stat().st_size > 0
+    except OSError:
+        return False
+
+
+def _report_response(path: Path, filename: str, download: int) -> FileResponse:
+    """
+    Stream a report file from disk. FileResponse uses sendfile on Linux,
+    so multi-MB reports never get copied into a Python string.
+    """
+    resp = FileResponse(path, media_type="text/html")
+    if download == 1:
+        resp.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    no_cache_headers(resp)
+    return resp
+
+
+@app.get("/api/report/latest")
 def api_report_latest(download: int = Query(default=0, ge=0, le=1)):
     """
     Returns the latest generated report HTML if available.
@@ -866,29 +1095,24 @@ def api_report_latest(download: int = Query(default=0, ge=0, le=1)):
     """
     ensure_dirs()
 
-    html = read_text(REPORT_LATEST_HTML)
+    path = REPORT_LATEST_HTML
     filename = "ModelShift-Lite_Report_Latest.html"
 
     # fallback: try latest run report by run_id
-    if not html:
-        latest = read_json(LATEST_JSON)
+    if not _report_file_ok(path):
+        latest = cached_read_json(LATEST_JSON)
         rid = latest.get("run_id")
-        if isinstance(rid, str) and SAFE_RUN_ID_RE.match(rid):
-            html = read_text(safe_report_path(rid))
+        if _is_safe_run_id(rid):
+            path = safe_report_path(rid)
             filename = f"{rid}.report.html"
 
-    if not html:
+    if not _report_file_ok(path):
         raise HTTPException(status_code=404, detail="No report available yet")
 
-    resp = HTMLResponse(content=html)
-    if download == 1:
-        resp.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
-
-    no_cache_headers(resp)
-    return resp
+    return _report_response(path, filename, download)
 
 
-@app.get("/api/report/{run_id}", response_class=HTMLResponse)
+@app.get("/api/report/{run_id}")
 def api_report_run(
     run_id: str,
     download: int = Query(default=0, ge=0, le=1),
@@ -903,20 +1127,14 @@ def api_report_run(
     if not p.exists():
         raise HTTPException(status_code=404, detail="Report not found for this run_id")
 
-    html = read_text(p)
-    if not html:
+    if not _report_file_ok(p):
         raise HTTPException(status_code=500, detail="Report file is empty/unreadable")
 
-    resp = HTMLResponse(content=html)
-    if download == 1:
-        resp.headers["Content-Disposition"] = f'attachment; filename="{run_id}.report.html"'
-
-    no_cache_headers(resp)
-    return resp
+    return _report_response(p, f"{run_id}.report.html", download)
 @app.get("/api/selftest")
 def api_selftest(response: Response):
     ensure_dirs()
-    data = read_json(SELFTEST_JSON)
+    data = cached_read_json(SELFTEST_JSON)
     no_cache_headers(response)
     return data if data else {"ok": False, "message": "No self-test run yet."}
 
@@ -940,7 +1158,7 @@ def api_selftest_run(response: Response):
             "stdout": (e.stdout or "")[:2000],
         }
 
-    data = read_json(SELFTEST_JSON)
+    data = cached_read_json(SELFTEST_JSON)
     no_cache_headers(response)
     return data if data else {"ok": False, "message": "Self-test ran, but output file missing/invalid."}
 # --- ADD THIS TO THE BOTTOM OF dashboard_web/app.py ---
@@ -952,7 +1170,7 @@ import numpy as np
 @app.get("/dataset/{run_id}", response_class=HTMLResponse)
 def view_dataset(run_id: str):
     ensure_dirs()
-    if not SAFE_RUN_ID_RE.match(run_id):
+    if not _is_safe_run_id(run_id):
         raise HTTPException(status_code=400, detail="Invalid run_id format")
 
     DATASETS_DIR = DATA_DIR / "datasets"
@@ -5,33 +5,55 @@ import matplotlib.pyplot as plt
 from modelshift.monitor import ModelMonitor
 
 
-def generate_baseline_data(n_samples=200):
-    return pd.DataFrame({
-        "feature_1": np.random.normal(loc=0.0, scale=1.0, size=n_samples),
-        "feature_2": np.random.normal(loc=5.0, scale=1.0, size=n_samples),
-    })
-
-
-def generate_live_data(baseline_df, drift_strength=0.0):
-    live_df = baseline_df.copy()
-    live_df["feature_1"] = live_df["feature_1"] + drift_strength
-    return live_df
+def generate_baseline_data(n_samples=200, rng=None):
+    """
+    Baseline features from a single new-style Generator; the DataFrame
+    wraps the ndarray without copying it.
+    """
+    if rng is None:
+        rng = np.random.default_rng(0)
+
+    base = rng.standard_normal((n_samples, 2))
+    base[:, 1] += 5.0
+    return pd.DataFrame(base, columns=["feature_1", "feature_2"], copy=False)
+
+
+def generate_live_data(baseline, drift_strength=0.0, out=None):
+    """
+    Shift feature_1 of a baseline ndarray by drift_strength, writing into
+    a caller-provided buffer so the simulation loop reuses one array.
+    """
+    if out is None:
+        out = baseline.copy()
+    else:
+        np.copyto(out, baseline)
+    out[:, 0] += drift_strength
+    return out
 
 
 def run_drift_simulation():
-    baseline_df = generate_baseline_data()
+    rng = np.random.default_rng(0)
+    baseline_df = generate_baseline_data(rng=rng)
+    columns = list(baseline_df.columns)
+    baseline = baseline_df.to_numpy()
+
     monitor = ModelMonitor(baseline_df)
 
     drift_levels = [0.0, 0.5, 1.0, 1.5, 2.0]
     ks_values = []
 
+    # One live buffer reused across drift levels; each DataFrame below is
+    # just a no-copy view over it.
+    live = baseline.copy()
+
     print("Running drift simulation...\n")
 
     for drift_level in drift_levels:
-        live_df = generate_live_data(baseline_df, drift_strength=drift_level)
+        generate_live_data(baseline, drift_strength=drift_level, out=live)
 
-        monitor.update(live_df)
-        drift_results = monitor.compute_feature_drift()
+        monitor.update(pd.DataFrame(live, columns=columns, copy=False))
+        # feature_2 is identical to baseline at every drift level, so skip it
+        drift_results = monitor.compute_feature_drift(columns=["feature_1"])
 
         ks_stat = drift_results["feature_1"]["ks_statistic"]
         ks_values.append(ks_stat)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -9,10 +10,38 @@ class BaselineWindow:
 
     def __init__(self, data: pd.DataFrame):
         self._validate(data)
-        self.data = data.copy()
+        # The KS statistic is invariant under monotone rescaling, so
+        # float32 is sufficient for drift detection and halves the bytes
+        # the sort/searchsorted kernels move through cache.
+        try:
+            data = data.astype(np.float32)
+        except (TypeError, ValueError):
+            # Non-numeric columns keep their original dtypes. Copy here:
+            # astype no longer detached us from the caller's frame, and the
+            # freeze below must never make the caller's own data read-only.
+            data = data.copy()
         self.feature_names = list(data.columns)
         self.num_samples = len(data)
 
+        # Baseline is immutable after construction, so sort each column
+        # once here and let repeated drift computations reuse it. Columns
+        # that cannot be cast to float (e.g. strings) keep their raw
+        # dtype — the KS computation only needs an orderable array.
+        self._sorted = {}
+        for col in self.feature_names:
+            series = data[col].dropna()
+            try:
+                values = series.to_numpy(dtype=np.float32)
+            except (TypeError, ValueError):
+                values = series.to_numpy()
+            self._sorted[col] = np.sort(values)
+
+        # Freeze-then-share: instead of defensively copying the frame we
+        # mark its underlying arrays read-only and alias it. Downstream
+        # drift code only reads, so this avoids a full-frame memcpy.
+        _freeze(data)
+        self.data = data
+
     def _validate(self, data):
         if not isinstance(data, pd.DataFrame):
             raise TypeError("Baseline data must be a pandas DataFrame")
@@ -22,9 +51,15 @@ class BaselineWindow:
 
     def get_data(self) -> pd.DataFrame:
         """
-        Returns a copy of baseline data.
+        Returns the (read-only) baseline data.
+        """
+        return self.data
+
+    def get_sorted(self, feature: str) -> np.ndarray:
+        """
+        Returns the cached ascending, NaN-free values for one feature.
         """
-        return self.data.copy()
+        return self._sorted[feature]
 
     def summary(self) -> dict:
         """
@@ -35,3 +70,17 @@ class BaselineWindow:
             "num_features": len(self.feature_names),
             "feature_names": self.feature_names,
         }
+
+
+def _freeze(data: pd.DataFrame) -> None:
+    """
+    Best-effort: mark the frame's backing ndarrays read-only so the
+    shared baseline cannot be mutated behind the monitor's back.
+    """
+    try:
+        for block in data._mgr.blocks:
+            block.values.flags.writeable = False
+    except (AttributeError, ValueError):
+        # Internal layout differs across pandas versions / array backends;
+        # sharing without the guard is still correct for read-only use.
+        pass
@@ -1,14 +1,48 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 import pandas as pd
-from scipy.stats import ks_2samp
+from scipy.special import kolmogorov
+
+
+# Below this many columns the threadpool costs more than it saves
+_PARALLEL_MIN_COLUMNS = 8
+
+
+@dataclass(frozen=True)
+class DriftArrays:
+    """
+    Structure-of-arrays view of a drift result: parallel arrays of
+    feature names, KS statistics and p-values. Stored under the
+    "_arrays" key of the result dict so downstream summaries can run as
+    single NumPy reductions instead of Python loops. Consumers that
+    iterate per-feature dicts skip it via their isinstance(dict) guards.
+    """
+    names: np.ndarray
+    ks: np.ndarray
+    p: np.ndarray
 
 
 def compute_feature_drift(
     baseline_data: pd.DataFrame,
-    live_data: pd.DataFrame
-) -> dict:
+    live_data: pd.DataFrame,
+    columns: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
     """
     Compute feature-level drift using the Kolmogorov–Smirnov test.
 
+    All NaN-free features are processed in a single vectorized pass:
+    baseline and live are stacked into one (n+m, F) array, argsorted
+    once along axis 0, and the KS statistic for every column falls out
+    of one cumulative sum. Columns containing NaN fall back to a
+    per-column path that drops NaN first.
+
+    `columns` optionally restricts the computation to a subset of
+    features, letting callers skip columns they know are unchanged.
+
     Returns a dictionary:
     {
         feature_name: {
@@ -20,23 +54,223 @@ def compute_feature_drift(
 
     _validate_inputs(baseline_data, live_data)
 
+    selected = _select_columns(list(baseline_data.columns), columns)
+    if columns is not None:
+        baseline_data = baseline_data[selected]
+        live_data = live_data[selected]
+    columns = selected
+
+    try:
+        baseline = baseline_data.to_numpy(dtype=np.float64, copy=False)
+        live = live_data.to_numpy(dtype=np.float64, copy=False)
+    except (TypeError, ValueError):
+        # Non-numeric column somewhere: per-column fallback for everything
+        return _attach_arrays({
+            col: _single_feature_drift(baseline_data[col], live_data[col])
+            for col in columns
+        })
+
+    nan_mask = np.isnan(baseline).any(axis=0) | np.isnan(live).any(axis=0)
+    clean_idx = np.flatnonzero(~nan_mask)
+
     drift_results = {}
 
-    for feature in baseline_data.columns:
-        baseline_values = baseline_data[feature].dropna()
-        live_values = live_data[feature].dropna()
+    if clean_idx.size:
+        ks, p_values = _ks_all_columns(baseline[:, clean_idx], live[:, clean_idx])
+        for j, ks_stat, p_value in zip(clean_idx, ks, p_values):
+            drift_results[columns[j]] = {
+                "ks_statistic": float(ks_stat),
+                "p_value": float(p_value),
+            }
 
-        ks_stat, p_value = ks_2samp(baseline_values, live_values)
+    for j in np.flatnonzero(nan_mask):
+        col = columns[j]
+        drift_results[col] = _single_feature_drift(baseline_data[col], live_data[col])
 
-        drift_results[feature] = {
-            "ks_statistic": float(ks_stat),
-            "p_value": float(p_value),
-        }
+    # Preserve baseline column order regardless of clean/NaN split
+    return _attach_arrays({col: drift_results[col] for col in columns})
+
+
+def _ks_all_columns(
+    baseline: np.ndarray, live: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Two-sample KS statistic and asymptotic p-value for every column at once.
+
+    Stacks both samples, sorts once, and accumulates signed empirical-CDF
+    increments (+1/n for baseline rows, -1/m for live rows); the KS statistic
+    is the largest absolute gap. The gap is only evaluated where the sorted
+    value changes so ties between samples cannot inflate the maximum.
+    """
+    n = baseline.shape[0]
+    m = live.shape[0]
+
+    combined = np.concatenate([baseline, live], axis=0)
+    order = np.argsort(combined, axis=0, kind="mergesort")
+
+    sign = np.where(order < n, 1.0 / n, -1.0 / m)
+    cdf_diff = np.cumsum(sign, axis=0)
+
+    sorted_vals = np.take_along_axis(combined, order, axis=0)
+    at_step = np.ones(combined.shape, dtype=bool)
+    at_step[:-1] = sorted_vals[1:] != sorted_vals[:-1]
+
+    # cumsum rounding can leave the max a few ulp outside [0, 1]
+    ks = np.clip(np.max(np.abs(cdf_diff) * at_step, axis=0), 0.0, 1.0)
+    p_values = kolmogorov(ks * np.sqrt(n * m / (n + m)))
+    return ks, p_values
+
+
+def compute_feature_drift_presorted(
+    baseline_sorted: Dict[str, np.ndarray],
+    live_data: pd.DataFrame,
+    columns: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """
+    Variant of compute_feature_drift for an immutable, already-sorted baseline.
+
+    baseline_sorted maps feature name -> ascending NaN-free ndarray (see
+    BaselineWindow.get_sorted). Only the live sample is sorted here; the KS
+    statistic is derived by searchsorted against both empirical CDFs, so the
+    O(N log N) baseline sort is paid once per baseline instead of per call.
+
+    `columns` optionally restricts the computation to a subset of features.
+
+    Returns the same dictionary shape as compute_feature_drift.
+    """
+    if not isinstance(live_data, pd.DataFrame):
+        raise TypeError("Live data must be a pandas DataFrame")
+
+    if live_data.empty:
+        raise ValueError("Live data cannot be empty")
+
+    if list(baseline_sorted.keys()) != list(live_data.columns):
+        raise ValueError("Baseline and live data must have identical features")
 
+    selected = _select_columns(list(baseline_sorted.keys()), columns)
+
+    def _one(feature: str) -> Dict[str, float]:
+        base_sorted = baseline_sorted[feature]
+        # Match the baseline dtype (float32 for BaselineWindow caches) so
+        # searchsorted does not upcast per comparison.
+        live_sorted = np.sort(
+            live_data[feature].dropna().to_numpy(dtype=base_sorted.dtype)
+        )
+        return _ks_presorted(base_sorted, live_sorted)
+
+    if len(selected) >= _PARALLEL_MIN_COLUMNS:
+        # Columns are independent and the sort/searchsorted kernels release
+        # the GIL, so wide frames scale across cores with plain threads.
+        workers = min(len(selected), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            drift_results = dict(zip(selected, executor.map(_one, selected)))
+    else:
+        drift_results = {feature: _one(feature) for feature in selected}
+
+    return _attach_arrays(drift_results)
+
+
+def _attach_arrays(drift_results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Attach the structure-of-arrays view under "_arrays".
+    """
+    names = list(drift_results)
+    count = len(names)
+    drift_results["_arrays"] = DriftArrays(
+        names=np.array(names, dtype=object),
+        ks=np.fromiter(
+            (drift_results[name]["ks_statistic"] for name in names),
+            dtype=np.float64, count=count,
+        ),
+        p=np.fromiter(
+            (drift_results[name]["p_value"] for name in names),
+            dtype=np.float64, count=count,
+        ),
+    )
     return drift_results
 
 
-def _validate_inputs(baseline_data, live_data):
+def _select_columns(
+    available: List[str], columns: Optional[Iterable[str]]
+) -> List[str]:
+    """
+    Resolve an optional column subset against the available features.
+    """
+    if columns is None:
+        return available
+
+    selected = list(columns)
+    unknown = [c for c in selected if c not in available]
+    if unknown:
+        raise ValueError(f"Unknown feature columns: {unknown}")
+    return selected
+
+
+def ks_2sample(baseline_values: Any, live_values: Any) -> Tuple[float, float]:
+    """
+    Two-sample KS statistic with the asymptotic Kolmogorov p-value.
+
+    Drop-in for scipy.stats.ks_2samp on the monitoring hot path: it skips
+    scipy's argument dispatch and exact small-sample p-value machinery,
+    which monitoring consumers never need. Like scipy, any orderable
+    dtype is accepted; numeric input takes the float64 fast path.
+
+    Returns (ks_statistic, p_value).
+    """
+    b = np.sort(_sortable_array(baseline_values))
+    l = np.sort(_sortable_array(live_values))
+    result = _ks_presorted(b, l)
+    return result["ks_statistic"], result["p_value"]
+
+
+def _sortable_array(values: Any) -> np.ndarray:
+    """
+    float64 when castable (the fast path); otherwise the raw dtype —
+    sort/searchsorted only need an orderable array, so string or
+    datetime columns still get a valid empirical CDF.
+    """
+    arr = np.asarray(values)
+    try:
+        return arr.astype(np.float64)
+    except (TypeError, ValueError):
+        return arr
+
+
+def _ks_presorted(
+    baseline_sorted: np.ndarray, live_sorted: np.ndarray
+) -> Dict[str, float]:
+    """
+    Two-sample KS for one feature from two already-sorted samples.
+    """
+    n = baseline_sorted.size
+    m = live_sorted.size
+
+    all_vals = np.concatenate([baseline_sorted, live_sorted])
+    cdf_b = np.searchsorted(baseline_sorted, all_vals, side="right") / n
+    cdf_l = np.searchsorted(live_sorted, all_vals, side="right") / m
+
+    ks = float(np.max(np.abs(cdf_b - cdf_l)))
+    p_value = float(kolmogorov(ks * np.sqrt(n * m / (n + m))))
+    return {"ks_statistic": ks, "p_value": p_value}
+
+
+def _single_feature_drift(
+    baseline_values: pd.Series, live_values: pd.Series
+) -> Dict[str, float]:
+    """
+    Per-column fallback for NaN or non-numeric columns.
+    """
+    ks_stat, p_value = ks_2sample(
+        baseline_values.dropna().to_numpy(),
+        live_values.dropna().to_numpy(),
+    )
+    return {
+        "ks_statistic": ks_stat,
+        "p_value": p_value,
+    }
+
+
+def _validate_inputs(baseline_data: pd.DataFrame, live_data: pd.DataFrame) -> None:
     if not isinstance(baseline_data, pd.DataFrame):
         raise TypeError("Baseline data must be a pandas DataFrame")
 
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
+from modelshift.drift.feature_drift import DriftArrays
+
 
 # ----------------------------
 # Basic per-signal thresholds
@@ -34,7 +38,20 @@ def classify_severity(ks_statistic: float) -> str:
     return "CRITICAL"
 
 
-def compute_health_score(feature_drift_results: dict) -> float:
+def classify_severity_vec(ks_values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized classify_severity: labels a whole KS array in one
+    np.select pass using the same thresholds.
+    """
+    ks = np.asarray(ks_values, dtype=np.float64)
+    return np.select(
+        [ks < FEATURE_KS_LOW, ks < FEATURE_KS_MEDIUM, ks < FEATURE_KS_HIGH],
+        ["LOW", "MEDIUM", "HIGH"],
+        default="CRITICAL",
+    )
+
+
+def compute_health_score(feature_drift_results: Dict[str, Any]) -> float:
     """
     Compute overall model health score (0–100) from feature drift.
     Higher score = healthier model.
@@ -42,6 +59,11 @@ def compute_health_score(feature_drift_results: dict) -> float:
     Uses average feature KS:
       health = max(0, 100 * (1 - avg_ks))
     """
+    if isinstance(feature_drift_results, dict):
+        arrays = feature_drift_results.get("_arrays")
+        if isinstance(arrays, DriftArrays) and arrays.ks.size:
+            return round(max(0.0, 100.0 * (1.0 - float(arrays.ks.mean()))), 2)
+
     summary = summarize_feature_drift(feature_drift_results)
     if summary["feature_count"] == 0:
         raise ValueError("Feature drift results cannot be empty")
@@ -51,7 +73,9 @@ def compute_health_score(feature_drift_results: dict) -> float:
     return round(float(health_score), 2)
 
 
-def summarize_feature_drift(feature_drift_results: Optional[dict]) -> Dict[str, Any]:
+def summarize_feature_drift(
+    feature_drift_results: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
     """
     Extract feature drift summary stats from feature_drift_results.
     Safe against missing/malformed values.
@@ -65,6 +89,20 @@ def summarize_feature_drift(feature_drift_results: Optional[dict]) -> Dict[str,
             "ks_values": [],
         }
 
+    # Fast path: drift results computed by this package carry a
+    # structure-of-arrays view, so the summary is pure NumPy reductions.
+    arrays = feature_drift_results.get("_arrays")
+    if isinstance(arrays, DriftArrays) and arrays.ks.size:
+        ks = arrays.ks
+        imax = int(ks.argmax())
+        return {
+            "feature_count": int(ks.size),
+            "avg_ks": round(float(ks.mean()), 6),
+            "max_ks": round(float(ks[imax]), 6),
+            "max_feature": str(arrays.names[imax]),
+            "ks_values": [round(float(v), 6) for v in ks],
+        }
+
     ks_pairs: List[tuple[str, float]] = []
     for feature, values in feature_drift_results.items():
         if not isinstance(values, dict):
@@ -96,8 +134,8 @@ def summarize_feature_drift(feature_drift_results: Optional[dict]) -> Dict[str,
 
 
 def classify_drift_taxonomy(
-    feature_drift_results: Optional[dict] = None,
-    prediction_drift_results: Optional[dict] = None,
+    feature_drift_results: Optional[Dict[str, Any]] = None,
+    prediction_drift_results: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
     Agreement/disagreement taxonomy between feature drift and prediction drift.
@@ -128,8 +166,8 @@ def classify_drift_taxonomy(
 
 
 def evaluate_drift_state(
-    feature_drift_results: Optional[dict] = None,
-    prediction_drift_results: Optional[dict] = None,
+    feature_drift_results: Optional[Dict[str, Any]] = None,
+    prediction_drift_results: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Composite severity + status decision engine.
@@ -9,15 +9,22 @@ import numpy as np
 import pandas as pd
 
 from modelshift.baseline import BaselineWindow
-from modelshift.drift.feature_drift import compute_feature_drift
+from modelshift.drift.feature_drift import (
+    DriftArrays,
+    compute_feature_drift,
+    compute_feature_drift_presorted,
+)
 from modelshift.drift.prediction_drift import compute_prediction_drift
 from modelshift.drift.severity import (
     classify_severity,
+    classify_severity_vec,
     compute_health_score,
     evaluate_drift_state,
     summarize_feature_drift,
 )
 
+__all__ = ["ModelMonitor", "init", "login"]
+
 # -------------------------------------------------------------------
 # Phase 2: Cloud SDK Configuration
 # -------------------------------------------------------------------
@@ -35,7 +42,7 @@ def init(api_key: str, dashboard_url: str = "http://127.0.0.1:8000"):
     # This automatically adds /api/v1/track to whatever URL the user provides
     _CLOUD_CONFIG["endpoint"] = f"{dashboard_url.rstrip('/')}/api/v1/track"
     print(f"[✓] ModelShift SDK Authenticated. Cloud sync enabled.")
-import requests
+
 
 def login(email: str, password: str, dashboard_url: str = "http://127.0.0.1:8000"):
     """Authenticates the user and automatically configures the API Key."""
@@ -77,7 +84,7 @@ class ModelMonitor:
         if reference_data.empty:
             raise ValueError("Reference data cannot be empty")
 
-        self.baseline = BaselineWindow(reference_data.copy())
+        self.baseline = BaselineWindow(reference_data)
 
         # Data containers
         self.live_data: Optional[pd.DataFrame] = None
@@ -114,22 +121,33 @@ class ModelMonitor:
                 f"Live data columns must match baseline columns. Missing={missing}, Extra={extra}"
             )
 
-        # Reorder to baseline column order for deterministic behavior
-        self.live_data = live_data[baseline_cols].copy()
+        # Reorder to baseline column order for deterministic behavior.
+        # Drift code only reads the live window, so share it instead of
+        # copying; the column selection below is a no-op when the caller
+        # already matches the baseline layout.
+        if live_cols == baseline_cols:
+            self.live_data = live_data
+        else:
+            self.live_data = live_data[baseline_cols]
 
     # -----------------------
     # Feature Drift
     # -----------------------
-    def compute_feature_drift(self) -> dict:
+    def compute_feature_drift(self, columns: Optional[List[str]] = None) -> dict:
         """
         Compute feature-level drift between baseline and live data.
+        Pass `columns` to restrict the test to a subset of features
+        (e.g. skipping columns known to be unchanged).
         """
         if self.live_data is None:
             raise RuntimeError("Live data not set. Call update() first.")
 
-        self.feature_drift_results = compute_feature_drift(
-            self.baseline.get_data(),
-            self.live_data
+        # Baseline is immutable, so reuse the per-column sort cached by
+        # BaselineWindow instead of re-sorting it on every live update.
+        self.feature_drift_results = compute_feature_drift_presorted(
+            self.baseline._sorted,
+            self.live_data,
+            columns=columns
         )
         return self.feature_drift_results
 
@@ -142,13 +160,25 @@ class ModelMonitor:
         if self.feature_drift_results is None:
             raise RuntimeError("No feature drift computed yet.")
 
-        severity = {}
-        for feature, values in self.feature_drift_results.items():
-            if not isinstance(values, dict):
-                continue
-            severity[feature] = classify_severity(values.get("ks_statistic", 0.0))
-
-        return severity
+        # Single np.select pass over the KS array instead of a Python
+        # branch per feature.
+        arrays = self.feature_drift_results.get("_arrays")
+        if isinstance(arrays, DriftArrays) and arrays.ks.size:
+            labels = classify_severity_vec(arrays.ks)
+            return {str(name): str(label) for name, label in zip(arrays.names, labels)}
+
+        features = [
+            feature
+            for feature, values in self.feature_drift_results.items()
+            if isinstance(values, dict)
+        ]
+        ks = np.fromiter(
+            (self.feature_drift_results[f].get("ks_statistic", 0.0) for f in features),
+            dtype=np.float64,
+            count=len(features),
+        )
+        labels = classify_severity_vec(ks)
+        return {str(feature): str(label) for feature, label in zip(features, labels)}
 
     def get_model_health_score(self) -> float:
         if self.feature_drift_results is None:
@@ -265,10 +295,6 @@ class ModelMonitor:
                 return None
 
             try:
-                import requests
-                import uuid
-                from datetime import datetime, timezone
-
                 feat_drift = getattr(self, 'feature_drift', {})
                 if not feat_drift:
                     feat_drift = {}
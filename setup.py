@@ -6,6 +6,23 @@ this_directory = os.path.abspath(os.path.dirname(__file__))
 with open(os.path.join(this_directory, "README.md"), encoding="utf-8") as f:
     long_description = f.read()
 
+# Optional AOT compilation of the hot drift modules with mypyc. Off by
+# default so plain installs stay pure-Python; set MODELSHIFT_MYPYC=1 (with
+# mypy installed) to build them as C extensions and strip the interpreter
+# overhead around the NumPy kernels.
+ext_modules = []
+if os.environ.get("MODELSHIFT_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        pass
+    else:
+        ext_modules = mypycify([
+            "modelshift/drift/feature_drift.py",
+            "modelshift/drift/prediction_drift.py",
+            "modelshift/drift/severity.py",
+        ])
+
 setup(
     name="modelshift",
     version="0.1.0",  # Update this every time you publish a new version
@@ -15,6 +32,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(include=["modelshift", "modelshift.*"]),
+    ext_modules=ext_modules,
     install_requires=[
         "pandas",
         "numpy",
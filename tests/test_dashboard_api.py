@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("starlette.testclient")
+
+from starlette.testclient import TestClient  # noqa: E402
+
+from dashboard_web import app as dashboard  # noqa: E402
+
+
+@pytest.fixture()
+def client():
+    return TestClient(dashboard.app)
+
+
+def test_api_results_etag_roundtrip(client):
+    first = client.get("/api/results")
+    assert first.status_code == 200
+
+    etag = first.headers.get("etag")
+    assert etag
+    # entity-tags are quoted strings per RFC 7232
+    assert etag.startswith('"') and etag.endswith('"')
+
+    second = client.get("/api/results", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers.get("etag") == etag
+
+    # weak validators and tag lists must match too
+    weak = client.get("/api/results", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert weak.status_code == 304
+
+
+def test_api_run_etag_roundtrip(client):
+    dashboard.ensure_dirs()
+    run_id = "test_etag_roundtrip"
+    run_path = dashboard.RUNS_DIR / f"{run_id}.json"
+    run_path.write_text(json.dumps({"run_id": run_id, "status": "STABLE"}))
+
+    try:
+        first = client.get(f"/api/run/{run_id}")
+        assert first.status_code == 200
+        assert first.json()["run_id"] == run_id
+
+        etag = first.headers.get("etag")
+        assert etag
+
+        second = client.get(f"/api/run/{run_id}", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+    finally:
+        run_path.unlink()
+        dashboard._RUN_PREBUILT.pop(run_id, None)
+        dashboard._JSON_CACHE.pop(run_path, None)
+
+
+def test_api_run_rejects_bad_run_id(client):
+    resp = client.get("/api/run/..%2F..%2Fetc")
+    assert resp.status_code in (400, 404)
@@ -1,7 +1,19 @@
 import numpy as np
 import pandas as pd
+import pytest
+from scipy.special import kolmogorov
+from scipy.stats import ks_2samp
 
-from modelshift.drift.feature_drift import compute_feature_drift
+from modelshift.drift.feature_drift import compute_feature_drift, ks_2sample
+
+
+def _asymp_pvalue(ks, n, m):
+    """
+    Classical asymptotic Kolmogorov p-value, which ks_2sample documents.
+    (scipy's method="asymp" uses the finite-n kstwo approximation instead,
+    so p-values are compared against this formula, not scipy's.)
+    """
+    return float(kolmogorov(ks * np.sqrt(n * m / (n + m))))
 
 
 def _extract_feature_map(fd):
@@ -47,4 +59,107 @@ def test_feature_drift_high_when_strong_shift():
     ks2 = float(fmap["f2"].get("ks_statistic", fmap["f2"].get("ks")))
 
     assert 0.80 <= ks1 <= 1.0
-    assert 0.80 <= ks2 <= 1.0
\ No newline at end of file
+    assert 0.80 <= ks2 <= 1.0
+
+
+def test_ks_2sample_matches_scipy_asymptotic():
+    rng = np.random.default_rng(42)
+    base = rng.standard_normal(300)
+    live = rng.standard_normal(250) + 0.3
+
+    ks, p = ks_2sample(base, live)
+    ref = ks_2samp(base, live, method="asymp")
+
+    assert abs(ks - ref.statistic) < 1e-12
+    assert abs(p - _asymp_pvalue(ks, base.size, live.size)) < 1e-12
+
+
+def test_ks_2sample_matches_scipy_with_ties():
+    # Discrete samples: heavy within- and cross-sample ties must not
+    # inflate the statistic.
+    rng = np.random.default_rng(7)
+    base = rng.integers(0, 5, size=400).astype(float)
+    live = rng.integers(0, 6, size=300).astype(float)
+
+    ks, p = ks_2sample(base, live)
+    ref = ks_2samp(base, live, method="asymp")
+
+    assert abs(ks - ref.statistic) < 1e-12
+    assert abs(p - _asymp_pvalue(ks, base.size, live.size)) < 1e-12
+
+
+def test_feature_drift_matches_scipy_per_column():
+    rng = np.random.default_rng(0)
+    base = pd.DataFrame({
+        "f1": rng.standard_normal(200),
+        "f2": rng.integers(0, 4, size=200).astype(float),
+    })
+    live = pd.DataFrame({
+        "f1": rng.standard_normal(180) + 0.5,
+        "f2": rng.integers(0, 4, size=180).astype(float),
+    })
+
+    fd = compute_feature_drift(base, live)
+    fmap = _extract_feature_map(fd)
+
+    for col in ("f1", "f2"):
+        ref = ks_2samp(base[col].to_numpy(), live[col].to_numpy(), method="asymp")
+        assert abs(fmap[col]["ks_statistic"] - ref.statistic) < 1e-12
+        assert abs(fmap[col]["p_value"] - _asymp_pvalue(ref.statistic, len(base), len(live))) < 1e-12
+
+
+def test_feature_drift_nan_columns_match_scipy():
+    rng = np.random.default_rng(1)
+    base = pd.DataFrame({
+        "clean": rng.standard_normal(150),
+        "holey": rng.standard_normal(150),
+    })
+    live = pd.DataFrame({
+        "clean": rng.standard_normal(150),
+        "holey": rng.standard_normal(150) + 1.0,
+    })
+    base.loc[::7, "holey"] = np.nan
+    live.loc[::5, "holey"] = np.nan
+
+    fd = compute_feature_drift(base, live)
+    fmap = _extract_feature_map(fd)
+
+    for col in ("clean", "holey"):
+        b = base[col].dropna().to_numpy()
+        l = live[col].dropna().to_numpy()
+        ref = ks_2samp(b, l, method="asymp")
+        assert abs(fmap[col]["ks_statistic"] - ref.statistic) < 1e-12
+        assert abs(fmap[col]["p_value"] - _asymp_pvalue(ref.statistic, b.size, l.size)) < 1e-12
+
+
+def test_feature_drift_non_numeric_columns_match_scipy():
+    # String (and other orderable) columns take the per-column fallback
+    # and must agree with scipy, which accepts any sortable dtype.
+    base = pd.DataFrame({"num": np.arange(100.0), "cat": list("abcd") * 25})
+    live = pd.DataFrame({"num": np.arange(100.0) + 10, "cat": list("abce") * 25})
+
+    fd = compute_feature_drift(base, live)
+    fmap = _extract_feature_map(fd)
+
+    for col in ("num", "cat"):
+        ref = ks_2samp(base[col].to_numpy(), live[col].to_numpy())
+        assert abs(fmap[col]["ks_statistic"] - ref.statistic) < 1e-12
+
+
+def test_feature_drift_columns_subset():
+    base = pd.DataFrame({"f1": np.arange(100.0), "f2": np.arange(100.0) * 2})
+    live = pd.DataFrame({"f1": np.arange(100.0) + 50, "f2": np.arange(100.0) * 2})
+
+    fd = compute_feature_drift(base, live, columns=["f2"])
+    fmap = _extract_feature_map(fd)
+
+    assert "f2" in fmap
+    assert "f1" not in fmap
+
+
+def test_feature_drift_rejects_unknown_columns():
+    base = pd.DataFrame({"f1": np.arange(100.0)})
+    live = base.copy()
+
+    with pytest.raises(ValueError):
+        compute_feature_drift(base, live, columns=["nope"])
\ No newline at end of file
@@ -1,5 +1,8 @@
 import numpy as np
 import pandas as pd
+import pytest
+from scipy.special import kolmogorov
+from scipy.stats import ks_2samp
 
 from modelshift.monitor import ModelMonitor
 
@@ -26,4 +29,62 @@ def test_monitor_end_to_end_smoke():
 
     # Health path
     hs = mon.get_model_health_score()
-    assert hs is not None
\ No newline at end of file
+    assert hs is not None
+
+
+def test_monitor_presorted_path_matches_scipy():
+    # The monitor reuses the baseline's cached sorted columns; the KS
+    # result must still agree with scipy on the float32-stored values.
+    rng = np.random.default_rng(3)
+    base = pd.DataFrame({
+        "f1": rng.standard_normal(300),
+        "f2": rng.standard_normal(300) * 2.0,
+    })
+    live = pd.DataFrame({
+        "f1": rng.standard_normal(250) + 0.4,
+        "f2": rng.standard_normal(250) * 2.0,
+    })
+
+    mon = ModelMonitor(base)
+    mon.update(live)
+    fd = mon.compute_feature_drift()
+
+    for col in ("f1", "f2"):
+        ref = ks_2samp(
+            base[col].to_numpy(dtype=np.float32),
+            live[col].to_numpy(dtype=np.float32),
+            method="asymp",
+        )
+        assert abs(fd[col]["ks_statistic"] - ref.statistic) < 1e-12
+        # p-value uses the classical asymptotic Kolmogorov distribution
+        en = np.sqrt(len(base) * len(live) / (len(base) + len(live)))
+        assert abs(fd[col]["p_value"] - kolmogorov(ref.statistic * en)) < 1e-12
+
+
+def test_monitor_handles_non_numeric_columns():
+    # String columns keep their raw dtype in the baseline sort cache and
+    # still produce drift results through the presorted path.
+    base = pd.DataFrame({"num": np.arange(100.0), "cat": list("abcd") * 25})
+    live = pd.DataFrame({"num": np.arange(100.0) + 10, "cat": list("abce") * 25})
+
+    mon = ModelMonitor(base)
+    mon.update(live)
+    fd = mon.compute_feature_drift()
+
+    ref = ks_2samp(base["cat"].to_numpy(), live["cat"].to_numpy())
+    assert abs(fd["cat"]["ks_statistic"] - ref.statistic) < 1e-12
+
+
+def test_monitor_feature_drift_column_subset():
+    base = pd.DataFrame({"f1": np.arange(100.0), "f2": np.arange(100.0) * 2})
+    live = base.copy()
+
+    mon = ModelMonitor(base)
+    mon.update(live)
+
+    fd = mon.compute_feature_drift(columns=["f1"])
+    assert "f1" in fd
+    assert "f2" not in fd
+
+    with pytest.raises(ValueError):
+        mon.compute_feature_drift(columns=["missing"])
\ No newline at end of file
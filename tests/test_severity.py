@@ -3,7 +3,11 @@ import pandas as pd
 
 from modelshift.drift.feature_drift import compute_feature_drift
 from modelshift.drift.prediction_drift import compute_prediction_drift
-from modelshift.drift.severity import compute_health_score
+from modelshift.drift.severity import (
+    classify_severity,
+    classify_severity_vec,
+    compute_health_score,
+)
 
 
 def _health_to_float(out):
@@ -53,4 +57,11 @@ def test_health_score_degrades_with_drift():
 
     assert np.isfinite(h_ok)
     assert np.isfinite(h_d)
-    assert h_ok > h_d  # drift should reduce health
\ No newline at end of file
+    assert h_ok > h_d  # drift should reduce health
+
+
+def test_classify_severity_vec_matches_scalar():
+    # Includes the exact threshold boundaries.
+    ks = np.array([0.0, 0.05, 0.10, 0.15, 0.20, 0.30, 0.35, 0.60, 1.0])
+    labels = classify_severity_vec(ks)
+    assert list(labels) == [classify_severity(float(v)) for v in ks]
\ No newline at end of file